@@ -1,7 +1,22 @@
 import re
 import requests
 import time
-
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+
+# 全局复用的会话（keep-alive + 连接池）
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+# 预编译正则：videoRenderer / gridVideoRenderer 合并为一次扫描，直接捕获视频ID
+_PAT_VIDEO_RENDERER = re.compile(r'"(?:gridV|v)ideoRenderer":\{"videoId":"([a-zA-Z0-9_-]{11})"', re.ASCII)
+
+@lru_cache(maxsize=64)
 def normalize_channel_input(channel_input):
     """标准化频道输入格式"""
     if not channel_input:
@@ -25,6 +40,7 @@ def normalize_channel_input(channel_input):
     else:
         return 'handle', channel_input
 
+@lru_cache(maxsize=64)
 def build_channel_streams_url(channel_input):
     """构建频道直播页面URL"""
     channel_type, clean_input = normalize_channel_input(channel_input)
@@ -39,7 +55,7 @@ def build_channel_streams_url(channel_input):
 
     return None
 
-def get_video_id_html(channel_input, timeout=30):
+def get_video_id_html(channel_input, timeout=30, session=_SESSION):
     """从HTML页面提取视频ID - 最小测试用例"""
     try:
         streams_url = build_channel_streams_url(channel_input)
@@ -49,41 +65,20 @@ def get_video_id_html(channel_input, timeout=30):
 
         print(f"🔍 访问URL: {streams_url}")
 
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
-
         response = session.get(streams_url, timeout=timeout, verify=True)
         response.raise_for_status()
         
         html_content = response.text
         print(f"✅ 成功获取HTML，长度: {len(html_content)} 字符")
 
-        # 第一个模式：videoRenderer
-        pattern1 = r'"videoRenderer":\{"videoId":"[^"]+"'
-        result = re.search(pattern1, html_content)
-
-        if result is None:
-            # 第二个模式：gridVideoRenderer
-            pattern2 = r'"gridVideoRenderer":\{"videoId":"[^"]+"'
-            result = re.search(pattern2, html_content)
-            print("🔄 尝试第二个模式")
+        # videoRenderer 或 gridVideoRenderer，一次扫描
+        result = _PAT_VIDEO_RENDERER.search(html_content)
 
         if result is not None:
-            matched_string = result.group()
-            print(f"🎯 匹配到: {matched_string}")
-            
-            # 提取视频ID
-            video_id_pattern = r':"([^"]+)"'
-            video_id_match = re.search(video_id_pattern, matched_string)
-
-            if video_id_match:
-                video_id = video_id_match.group(1)
-                print(f"✅ 提取到视频ID: {video_id}")
-                return video_id
+            print(f"🎯 匹配到: {result.group()}")
+            video_id = result.group(1)
+            print(f"✅ 提取到视频ID: {video_id}")
+            return video_id
 
         print("❌ 未找到视频ID模式")
         return None
@@ -1,7 +1,16 @@
 # spyder_live_video_id.py
 import re
+import json
 import time
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # 手动填写你的频道名/handle/链接，例如：
 #   "@xczphysics"
@@ -9,6 +18,7 @@ import requests
 #   "https://youtube.com/@尘竹-3-梦瑶"
 CHANNEL_INPUT = "@xczphysics"
 
+@lru_cache(maxsize=64)
 def normalize_channel_input(channel_input: str):
     if not channel_input:
         return None, None
@@ -24,6 +34,7 @@ def normalize_channel_input(channel_input: str):
         return 'handle', s[1:]
     return 'handle', s
 
+@lru_cache(maxsize=64)
 def build_channel_urls(channel_input: str):
     t, v = normalize_channel_input(channel_input)
     if not t or not v:
@@ -36,23 +47,22 @@ def build_channel_urls(channel_input: str):
         streams_url = f"https://www.youtube.com/channel/{v}/streams"
     return live_url, streams_url
 
-def new_session():
-    s = requests.Session()
-    s.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                      'AppleWebKit/537.36 (KHTML, like Gecko) '
-                      'Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.8',
-        'Cache-Control': 'no-cache',
-        'Pragma': 'no-cache',
-        'Connection': 'keep-alive',
-    })
-    return s
-
-def get_video_id_via_live(live_url: str, timeout=10):
+# 全局复用的会话：keep-alive + 连接池，避免每次请求重新握手 TCP/TLS
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                  'AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.8',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'Connection': 'keep-alive',
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+def get_video_id_via_live(live_url: str, timeout=10, s=_SESSION):
     try:
-        s = new_session()
         # 先允许重定向，很多情况下最终URL就是 /watch?v=...
         r = s.get(live_url, timeout=timeout, allow_redirects=True)
         final_url = r.url or ""
@@ -71,45 +81,103 @@ def get_video_id_via_live(live_url: str, timeout=10):
     except requests.RequestException:
         return None
 
-def fetch_html(url: str, timeout=10):
-    ts = int(time.time() * 1000)  # 简单防缓存
-    url = url + ("&_ts=" if "?" in url else "?_ts=") + str(ts)
-    s = new_session()
-    r = s.get(url, timeout=timeout, verify=True, allow_redirects=True)
-    r.raise_for_status()
-    return r.text
+# 按 URL 记录 ETag 与对应页面，条件请求命中 304 时直接复用，不再下载正文
+_ETAG_CACHE = {}
+
+def fetch_html(url: str, timeout=10, s=_SESSION):
+    # 不再追加 _ts 防缓存参数：依赖 ETag 重新验证（会话已带 no-cache，304 仍然可用）
+    cached = _ETAG_CACHE.get(url)
+    headers = {'If-None-Match': cached[0]} if cached else None
+    # 流式读取：拿到完整 ytInitialData 后立即停止下载
+    marker, end = b'var ytInitialData = ', b';</script>'
+    r = s.get(url, timeout=timeout, verify=True, allow_redirects=True, stream=True, headers=headers)
+    try:
+        if r.status_code == 304 and cached:
+            return cached[1]
+        r.raise_for_status()
+        buf = bytearray()
+        i = -1
+        scan_pos = 0  # 只扫描新到的数据（回退一个标记长度以覆盖跨块的标记），避免每块都从头查找
+        for chunk in r.iter_content(chunk_size=65536):
+            buf += chunk
+            if i < 0:
+                i = buf.find(marker, scan_pos)
+                if i < 0:
+                    scan_pos = max(0, len(buf) - len(marker))
+                    continue
+                scan_pos = i + len(marker)
+            j = buf.find(end, scan_pos)
+            if j >= 0:
+                del buf[j + len(end):]
+                break
+            scan_pos = max(i + len(marker), len(buf) - len(end))
+        html = buf.decode(r.encoding or 'utf-8', errors='replace')
+        etag = r.headers.get('ETag')
+        if etag:
+            _ETAG_CACHE[url] = (etag, html)
+        return html
+    finally:
+        r.close()
+
+# 预编译正则：只定位 videoId，LIVE 判定交给有界窗口内的 str 查找（线性扫描，无回溯）
+_VIDEO_ID_RE = re.compile(r'"videoId":"([A-Za-z0-9_-]{11})"', re.ASCII)
+_LIVE_MARKERS = ('"style":"LIVE"', '"isLive":true', '"isLiveNow":true')
+_WINDOW = 400
+
+def parse_yt_initial_data(html: str):
+    # 直接解析 ytInitialData，比正则挖 HTML 更稳（不受字段顺序影响）
+    marker = 'var ytInitialData = '
+    i = html.find(marker)
+    if i < 0:
+        return None
+    i += len(marker)
+    j = html.find(';</script>', i)
+    if j < 0:
+        return None
+    try:
+        return _json_loads(html[i:j])
+    except ValueError:
+        return None
+
+def iter_video_renderers(node):
+    if isinstance(node, dict):
+        for k, v in node.items():
+            if k in ('videoRenderer', 'gridVideoRenderer') and isinstance(v, dict):
+                yield v
+            else:
+                yield from iter_video_renderers(v)
+    elif isinstance(node, list):
+        for v in node:
+            yield from iter_video_renderers(v)
+
+def is_live_renderer(r: dict):
+    for overlay in r.get('thumbnailOverlays', ()):
+        status = overlay.get('thumbnailOverlayTimeStatusRenderer')
+        if status and status.get('style') == 'LIVE':
+            return True
+    return False
 
 def extract_live_ids_from_streams_html(html: str):
     # 只收集带 "LIVE" 或 isLive 的条目，降低拿到预告/回放的概率
+    data = parse_yt_initial_data(html)
+    if data is not None:
+        ids = [r['videoId'] for r in iter_video_renderers(data.get('contents', data))
+               if r.get('videoId') and is_live_renderer(r)]
+        return list(dict.fromkeys(ids))
+
+    # 兜底：解析失败时退回线性扫描
     ids = []
-    seen = set()
-    def add(vid):
-        if len(vid) == 11 and vid not in seen:
-            ids.append(vid)
-            seen.add(vid)
-
-    # videoRenderer / gridVideoRenderer 中带 LIVE 标记或 isLive:true
-    patterns = [
-        r'"videoRenderer":\{[^}]*"videoId":"([^"]+)"[^}]*"thumbnailOverlayTimeStatusRenderer":\{"style":"LIVE"',
-        r'"gridVideoRenderer":\{[^}]*"videoId":"([^"]+)"[^}]*"thumbnailOverlayTimeStatusRenderer":\{"style":"LIVE"',
-        r'"videoRenderer":\{[^}]*"videoId":"([^"]+)"[^}]*"isLiveNow":true',
-        r'"gridVideoRenderer":\{[^}]*"videoId":"([^"]+)"[^}]*"isLive":true',
-    ]
-    for pat in patterns:
-        for m in re.finditer(pat, html, flags=re.DOTALL):
-            add(m.group(1))
-
-    # 兜底：isLive:true 邻近 videoId
-    for m in re.finditer(r'"videoId":"([^"]+)"[^}]{0,800}"isLive":true', html, flags=re.DOTALL):
-        add(m.group(1))
-
-    return ids
-
-def verify_live_on_watch(video_id: str, timeout=8):
+    for m in _VIDEO_ID_RE.finditer(html):
+        window = html[max(0, m.start() - _WINDOW): m.end() + _WINDOW]
+        if any(marker in window for marker in _LIVE_MARKERS):
+            ids.append(m.group(1))
+    # 去重并保持顺序
+    return list(dict.fromkeys(ids))
+
+def verify_live_on_watch(video_id: str, timeout=8, s=_SESSION):
     # 不依赖 chat（避免禁言导致误判），看 watch 页的 isLive 信号
     url = f"https://www.youtube.com/watch?v={video_id}&hl=en"
     try:
-        s = new_session()
         r = s.get(url, timeout=timeout, allow_redirects=True)
         if r.status_code != 200:
             return False
@@ -5,37 +5,123 @@ YouTube Live Chat Manager - Sequential init, main-thread timers, main-thread OBS
 import os
 import re
 import json
+import mmap
+import socket
 import time
-import ssl
+import heapq
+import itertools
+import queue
 import threading
-import urllib.parse
-import urllib.request
 from datetime import datetime
 from collections import deque
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
 import obspython as obs
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode br responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 DEFAULT_BASE_INIT_INTERVAL = 1
 DEFAULT_REFRESH_COOLDOWN = 12
 DEFAULT_MAX_INIT_ATTEMPTS = 3
 DEFAULT_MAX_INIT_INTERVAL = 23
 DEFAULT_UPDATE_INTERVAL = 23
-
-SHARE_LINK_PATTERN = re.compile(r'https://youtube\.com/live/[a-zA-Z0-9_-]+\?feature=share')
+HTML_CACHE_TTL = 5
+HTML_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_LOG_LEVEL = obs.LOG_INFO
+REFRESH_INTERVAL_MS = 10000
+UPDATE_PROBE_BURST = 3
+REFRESH_IDLE_INTERVAL_MS = 30000
+REFRESH_MIN_GAP = 60
+WATCH_FALLBACK_SCAN_SECONDS = 30
+
+SHARE_LINK_PREFIX = "https://youtube.com/live/"
+SHARE_LINK_SUFFIX = "?feature=share"
+SHARE_LINK_KEY = b'"shareLink"'
+VIDEO_RENDERER_PATTERN = re.compile(rb'"(?:gridV|v)ideoRenderer":\{"videoId":"([a-zA-Z0-9_-]{11})"', re.ASCII)
+YT_INITIAL_DATA_MARKER = b'var ytInitialData = '
+YT_INITIAL_DATA_END = b';</script>'
+POPOUT_CHAT_URL = "https://www.youtube.com/live_chat?is_popout=1&v={}"
+# returned by the init probe fan-out when the only answer was a throttled HTML probe
+PROBE_THROTTLED = object()
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# one pooled keep-alive session for every HTTP call (HTML probes + Data API)
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+def is_share_link(link):
+    # same acceptance as SHARE_LINK_PATTERN.match (prefix match, trailing text allowed), without re
+    if not link.startswith(SHARE_LINK_PREFIX):
+        return False
+    q = link.find("?", len(SHARE_LINK_PREFIX))
+    if q <= len(SHARE_LINK_PREFIX) or not link.startswith(SHARE_LINK_SUFFIX, q):
+        return False
+    video_id = link[len(SHARE_LINK_PREFIX):q]
+    # isascii() first: str.isalnum() alone would accept non-ASCII letters and digits
+    return video_id.isascii() and video_id.replace("-", "a").replace("_", "a").isalnum()
 
 class Logger:
     def __init__(self):
-        self._lock = threading.Lock()
-        self._seq = 0
+        self._seq = itertools.count(1)
+        self._ts_cache = (None, "")
+        # OBS levels grow less severe upwards (ERROR=100 ... DEBUG=400); anything above is dropped
+        self._min_level = obs.LOG_INFO
+
+    def set_min_level(self, level):
+        self._min_level = level
+
+    def enabled(self, level):
+        return level <= self._min_level
+
+    def _timestamp(self):
+        # strftime only once per second; milliseconds come from integer nanoseconds.
+        # (sec, prefix) is swapped as one tuple so lock-free readers never see a torn pair
+        now_ns = time.time_ns()
+        sec = now_ns // 1_000_000_000
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{now_ns // 1_000_000 % 1000:03d}"
 
     def log(self, level, message):
-        with self._lock:
-            self._seq += 1
-            ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-            thread_name = threading.current_thread().name
-            formatted_msg = f"[{ts}][{thread_name}][#{self._seq:06d}] {message}"
-            obs.script_log(level, formatted_msg)
+        if level > self._min_level:
+            return
+        seq = next(self._seq)
+        ts = self._timestamp()
+        thread_name = threading.current_thread().name
+        formatted_msg = f"[{ts}][{thread_name}][#{seq:06d}] {message}"
+        obs.script_log(level, formatted_msg)
 
 logger = Logger()
 
@@ -44,16 +130,18 @@ class MainThreadDispatcher:
         self.interval_ms = int(interval_ms)
         self.max_tasks_per_tick = max_tasks_per_tick
         self._queue_lock = threading.Lock()
-        self._queue = deque()
+        self._immediate = queue.SimpleQueue()
+        self._timed = []
+        self._pending = {}
         self._active = False
-        self._task_seq = 0
+        self._task_ids = itertools.count(1)
 
     def _is_important(self, label):
         if not label:
             return False
-        if label.startswith(("start_", "stop_", "debug")):
+        if label.startswith("debug"):
             return True
-        if label in ("init:apply_url", "apply_url_to_source"):
+        if label in ("init:apply_url", "apply_url_to_source", "timers:reconcile"):
             return True
         return False
 
@@ -72,36 +160,66 @@ class MainThreadDispatcher:
         except Exception:
             pass
         self._active = False
+        self._drain_immediate()
         with self._queue_lock:
-            self._queue.clear()
+            self._timed.clear()
+            self._pending.clear()
         logger.log(obs.LOG_INFO, "🧰 [DISPATCH] stopped")
 
-    def post(self, fn, *, delay_ms=0, label=None):
-        run_at = time.time() + max(0, delay_ms) / 1000.0
-        with self._queue_lock:
-            self._task_seq += 1
-            task_id = self._task_seq
-            self._queue.append((run_at, label, fn, task_id, time.time()))
-        if self._is_important(label):
+    def post(self, fn, *, delay_ms=0, label=None, dedup_label=True):
+        now = time.monotonic()
+        run_at = now + max(delay_ms, 0) / 1000.0
+        task_id = next(self._task_ids)
+        if dedup_label and label is not None:
+            # one slot per label: newest fn wins, earliest due time wins
+            with self._queue_lock:
+                slot = self._pending.get(label)
+                if slot is not None and slot[1] <= run_at:
+                    slot[0] = fn
+                    return None
+                self._pending[label] = [fn, run_at, task_id]
+            fn = None
+        if delay_ms <= 0:
+            # worker threads post here without contending with _pump for the heap lock
+            self._immediate.put((label, fn, task_id, now))
+        else:
+            with self._queue_lock:
+                # task_id breaks run_at ties so fn objects are never compared
+                heapq.heappush(self._timed, (run_at, task_id, label, fn, now))
+        if self._is_important(label) and logger.enabled(obs.LOG_INFO):
             logger.log(obs.LOG_INFO, f"📌 [DISPATCH] queued#{task_id}: {label}, delay={delay_ms}ms")
         return task_id
 
-    def _pump(self):
-        now = time.time()
+    def _drain_immediate(self, limit=None):
         items = []
-        executed = 0
-        with self._queue_lock:
-            while self._queue and executed < self.max_tasks_per_tick:
-                run_at, label, fn, task_id, queued_at = self._queue[0]
-                if run_at > now:
-                    break
-                self._queue.popleft()
-                items.append((label, fn, task_id, queued_at))
-                executed += 1
+        while limit is None or len(items) < limit:
+            try:
+                items.append(self._immediate.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _pump(self):
+        if self._immediate.empty() and not self._timed:
+            return
+        now = time.monotonic()
+        items = self._drain_immediate(self.max_tasks_per_tick)
+        if self._timed and len(items) < self.max_tasks_per_tick:
+            with self._queue_lock:
+                while self._timed and self._timed[0][0] <= now and len(items) < self.max_tasks_per_tick:
+                    _, task_id, label, fn, queued_at = heapq.heappop(self._timed)
+                    items.append((label, fn, task_id, queued_at))
         for label, fn, task_id, queued_at in items:
+            if fn is None:
+                with self._queue_lock:
+                    slot = self._pending.get(label)
+                    if slot is None or slot[2] != task_id:
+                        continue
+                    del self._pending[label]
+                fn = slot[0]
             try:
-                if self._is_important(label):
-                    wait_ms = int((time.time() - queued_at) * 1000)
+                if self._is_important(label) and logger.enabled(obs.LOG_INFO):
+                    wait_ms = int((time.monotonic() - queued_at) * 1000)
                     logger.log(obs.LOG_INFO, f"▶️ [DISPATCH] running#{task_id}: {label}, waited={wait_ms}ms")
                 fn()
             except Exception as e:
@@ -109,26 +227,57 @@ class MainThreadDispatcher:
 
 _dispatcher = MainThreadDispatcher()
 
-class YouTubeService:
-    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+class ProbeCancelled(Exception):
+    pass
+
+class ProbeThrottled(Exception):
+    pass
+
+class TokenBucket:
+    def __init__(self, rate_per_s, burst):
+        self.rate = rate_per_s
+        self.burst = burst
+        self.tokens = burst
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_consume(self, n=1):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            if self.tokens < n:
+                return False
+            self.tokens -= n
+            return True
 
+class YouTubeService:
     def __init__(self, api_key=None):
         self.api_key = api_key
         self._request_lock = threading.Lock()
-        self._last_request_time = 0
+        self._last_request_time = float("-inf")
         self.consecutive_failures = 0
         self.api_call_count = 0
         self.total_quota_used = 0
-
-    def _rate_limit(self, min_interval=2):
+        self._etag_cache = {}
+        self._channel_id_cache = {}
+        self._live_validator = None
+        self._html_cache = {}
+        self._inflight = set()
+        self.live_page_changed = True
+
+    def _try_request_slot(self, min_interval=2):
+        # non-blocking: a caller that comes too soon is turned away instead of sleeping
         with self._request_lock:
-            now = time.time()
-            delta = now - self._last_request_time
-            if delta < min_interval:
-                time.sleep(min_interval - delta)
-            self._last_request_time = time.time()
+            now = time.monotonic()
+            if now - self._last_request_time < min_interval:
+                return False
+            self._last_request_time = now
+            return True
 
-    def normalize_channel_input(self, channel_input):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def normalize_channel_input(channel_input):
         if not channel_input:
             return None, None
         s = channel_input.strip()
@@ -145,15 +294,60 @@ class YouTubeService:
             return 'handle', s[1:]
         return 'handle', s
 
-    def build_streams_url(self, channel_input):
-        t, c = self.normalize_channel_input(channel_input)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def build_streams_url(channel_input):
+        t, c = YouTubeService.normalize_channel_input(channel_input)
         if not t:
             return None
         if t == 'handle':
             return f"https://www.youtube.com/@{c}/streams"
         return f"https://www.youtube.com/channel/{c}/streams"
 
-    def get_video_id_html(self, channel_input, timeout=23):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def build_live_url(channel_input):
+        t, c = YouTubeService.normalize_channel_input(channel_input)
+        if not t:
+            return None
+        if t == 'handle':
+            return f"https://www.youtube.com/@{c}/live"
+        return f"https://www.youtube.com/channel/{c}/live"
+
+    def get_video_id_via_live(self, channel_input, timeout=10):
+        live_url = self.build_live_url(channel_input)
+        if not live_url:
+            logger.log(obs.LOG_WARNING, "🌐 [LIVE] invalid channel input (empty or unrecognized)")
+            return None
+        try:
+            # not rate limited: a bodyless HEAD that runs alongside the streams page probe
+            logger.log(obs.LOG_INFO, f"🌐 [LIVE] redirect probe: url={live_url}, timeout={timeout}s")
+            t0 = time.perf_counter()
+            # HEAD without following redirects: Location plus validators, no body
+            resp = _SESSION.head(live_url, timeout=timeout, allow_redirects=False)
+            elapsed = time.perf_counter() - t0
+            loc = resp.headers.get("Location", "")
+            validator = (resp.headers.get("Last-Modified"), resp.headers.get("ETag"))
+            if validator == (None, None):
+                self.live_page_changed = True
+            else:
+                self.live_page_changed = validator != self._live_validator
+                self._live_validator = validator
+            logger.log(obs.LOG_INFO, f"🌐 [LIVE] response: status={resp.status_code}, elapsed={elapsed:.2f}s, location={loc or '-'}")
+            if "/watch?v=" in loc:
+                video_id = loc.split("v=")[-1].split("&")[0]
+                if len(video_id) == 11:
+                    logger.log(obs.LOG_INFO, f"🟢 [LIVE] videoId found: {video_id}")
+                    self.consecutive_failures = 0
+                    return video_id
+            logger.log(obs.LOG_INFO, "ℹ️ [LIVE] no watch redirect")
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.log(obs.LOG_WARNING, f"🔌 [LIVE] request error: {e}")
+            self.live_page_changed = True
+            return None
+
+    def get_video_id_html(self, channel_input, timeout=23, cancel_event=None):
         t, c = self.normalize_channel_input(channel_input)
         try:
             streams_url = self.build_streams_url(channel_input)
@@ -161,47 +355,90 @@ class YouTubeService:
                 logger.log(obs.LOG_WARNING, "🌐 [HTML] invalid channel input (empty or unrecognized)")
                 return None
 
-            self._rate_limit(min_interval=2)
-            headers = {
-                'User-Agent': self.USER_AGENT,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            # back-to-back probes (init retries, update timer) within the TTL reuse the last answer
+            cached = self._html_cache.get(streams_url)
+            if cached and time.monotonic() - cached[1] < HTML_CACHE_TTL:
+                logger.log(obs.LOG_INFO, f"♻️ [HTML] cached result reused: videoId={cached[0]}")
+                return cached[0]
+
+            if not self._try_request_slot(min_interval=2):
+                # None would mean "no live stream", so with nothing cached the caller must retry
+                logger.log(obs.LOG_INFO, "⏭️ [HTML] throttled (<2s since last request)")
+                if cached:
+                    return cached[0]
+                raise ProbeThrottled()
             logger.log(
                 obs.LOG_INFO,
                 f"🌐 [HTML] request start: url={streams_url}, channel_type={t}, key={c}, timeout={timeout}s"
             )
-            session = requests.Session()
-            session.headers.update(headers)
-            t0 = time.time()
-            resp = session.get(streams_url, timeout=(min(30, timeout//2), timeout), allow_redirects=True)
-            elapsed = time.time() - t0
+            headers = {}
+            if cached and cached[2]:
+                headers["If-Modified-Since"] = cached[2]
+            if cached and cached[3]:
+                headers["If-None-Match"] = cached[3]
+            t0 = time.perf_counter()
+            resp = _SESSION.get(streams_url, timeout=(min(30, timeout//2), timeout),
+                                allow_redirects=True, stream=True, headers=headers)
+            with self._request_lock:
+                self._inflight.add(resp)
+            try:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ProbeCancelled()
+                if resp.status_code == 304 and cached:
+                    logger.log(obs.LOG_INFO, f"♻️ [HTML] 304 not modified: videoId={cached[0]}")
+                    self._html_cache[streams_url] = (cached[0], time.monotonic(), cached[2], cached[3])
+                    return cached[0]
+                resp.raise_for_status()
+                body = self._read_until_initial_data(resp, cancel_event=cancel_event)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ProbeCancelled()
+            except ProbeCancelled:
+                raise
+            except Exception:
+                # an abort_inflight() close surfaces as a read error; report it as the cancel it is
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ProbeCancelled()
+                raise
+            finally:
+                with self._request_lock:
+                    self._inflight.discard(resp)
+                resp.close()
+            elapsed = time.perf_counter() - t0
             status = resp.status_code
             redirect_count = len(resp.history)
-            text = resp.text
-            content_len = len(text) if text is not None else 0
+            content_len = len(body)
             logger.log(
                 obs.LOG_INFO,
                 f"🌐 [HTML] response: status={status}, redirects={redirect_count}, elapsed={elapsed:.2f}s, len={content_len}"
             )
-            resp.raise_for_status()
+            validators = (resp.headers.get("Last-Modified") or resp.headers.get("Date"), resp.headers.get("ETag"))
 
-            m = re.search(r'"videoRenderer":\{"videoId":"([^"]+)"', text)
-            if not m:
-                m = re.search(r'"gridVideoRenderer":\{"videoId":"([^"]+)"', text)
+            video_id = None
+            data = self._parse_initial_data(body)
+            if data is not None:
+                video_id = next(self._iter_live_video_ids(data), None)
+            else:
+                logger.log(obs.LOG_INFO, "ℹ️ [HTML] ytInitialData not parsed, falling back to regex")
+                m = VIDEO_RENDERER_PATTERN.search(body)
+                if m:
+                    video_id = m.group(1).decode("ascii")
 
-            if m:
-                video_id = m.group(1)
+            if video_id:
+                self._html_cache[streams_url] = (video_id, time.monotonic()) + validators
                 logger.log(obs.LOG_INFO, f"🟢 [HTML] videoId found: {video_id}")
                 self.consecutive_failures = 0
                 return video_id
 
+            self._html_cache.pop(streams_url, None)
             logger.log(obs.LOG_INFO, "ℹ️ [HTML] no live videoId detected on streams page")
             self.consecutive_failures += 1
             return None
 
+        except ProbeThrottled:
+            raise
+        except ProbeCancelled:
+            logger.log(obs.LOG_INFO, "🛑 [HTML] probe cancelled")
+            return None
         except requests.exceptions.Timeout:
             logger.log(obs.LOG_WARNING, f"⏰ [HTML] timeout after {timeout}s (type={t}, key={c})")
             self.consecutive_failures += 1
@@ -219,30 +456,122 @@ class YouTubeService:
             self.consecutive_failures += 1
             return None
 
-    def _create_ssl_context(self):
-        return ssl.create_default_context()
+    def abort_inflight(self):
+        # shutdown() on a dup of the fd wakes a blocked read; a cross-thread close() may not
+        with self._request_lock:
+            responses = list(self._inflight)
+        for resp in responses:
+            try:
+                dup = socket.fromfd(resp.raw.fileno(), socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    dup.shutdown(socket.SHUT_RDWR)
+                finally:
+                    dup.close()
+            except (OSError, ValueError, AttributeError):
+                pass
+            try:
+                resp.close()
+            except Exception:
+                pass
+
+    def _read_until_initial_data(self, resp, chunk_size=65536, cancel_event=None):
+        # stop downloading once the ytInitialData blob is complete; the rest of the page is never needed.
+        # the raw bytes are returned undecoded: json loaders and the fallback regex both take bytes
+        marker = YT_INITIAL_DATA_MARKER
+        end = YT_INITIAL_DATA_END
+        buf = bytearray()
+        start = -1
+        scan_pos = 0
+        for chunk in resp.iter_content(chunk_size=chunk_size):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ProbeCancelled()
+            if len(buf) >= HTML_MAX_BYTES:
+                # a page this large is malformed for our purposes; the regex fallback gets what we have
+                logger.log(obs.LOG_WARNING, f"⚠️ [HTML] body cap reached ({HTML_MAX_BYTES} bytes), stopping read")
+                break
+            buf += chunk
+            if start < 0:
+                start = buf.find(marker, scan_pos)
+                if start < 0:
+                    scan_pos = max(0, len(buf) - len(marker))
+                    continue
+                scan_pos = start + len(marker)
+            j = buf.find(end, scan_pos)
+            if j >= 0:
+                del buf[j + len(end):]
+                break
+            scan_pos = max(start + len(marker), len(buf) - len(end))
+        return buf
+
+    def _parse_initial_data(self, body):
+        i = body.find(YT_INITIAL_DATA_MARKER)
+        if i < 0:
+            return None
+        i += len(YT_INITIAL_DATA_MARKER)
+        j = body.find(YT_INITIAL_DATA_END, i)
+        if j < 0:
+            return None
+        try:
+            return _json_loads(body[i:j])
+        except ValueError:
+            return None
+
+    def _iter_video_renderers(self, node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("videoRenderer", "gridVideoRenderer") and isinstance(value, dict):
+                    yield value
+                else:
+                    yield from self._iter_video_renderers(value)
+        elif isinstance(node, list):
+            for value in node:
+                yield from self._iter_video_renderers(value)
+
+    def _iter_live_video_ids(self, data):
+        for r in self._iter_video_renderers(data.get("contents", data)):
+            for overlay in r.get("thumbnailOverlays", ()):
+                status = overlay.get("thumbnailOverlayTimeStatusRenderer")
+                if status and status.get("style") == "LIVE" and r.get("videoId"):
+                    yield r["videoId"]
+                    break
+
+    def _api_get(self, endpoint, params, cost, timeout=20):
+        # conditional GET: a 304 on a cached ETag returns the cached body and costs no quota
+        cache_key = (endpoint, tuple(sorted((k, v) for k, v in params.items() if k != "key")))
+        cached = self._etag_cache.get(cache_key)
+        headers = {"Cache-Control": "max-age=0"}
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        self.api_call_count += 1
+        resp = _SESSION.get(f"https://www.googleapis.com/youtube/v3/{endpoint}",
+                            params=params, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and cached:
+            return cached[1], 0
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+        self.total_quota_used += cost
+        etag = resp.headers.get("ETag") or data.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, data)
+        return data, cost
 
     def _api_search_handle(self, handle):
         if not self.api_key:
             return None
         try:
-            self.api_call_count += 1
-            self.total_quota_used += 100
-            q = urllib.parse.urlencode({
+            q = {
                 "part": "snippet",
                 "q": handle,
                 "type": "channel",
                 "key": self.api_key,
                 "maxResults": 1
-            })
+            }
             logger.log(obs.LOG_INFO, f"🌐 [API] resolve handle -> channelId: @{handle}")
-            ctx = self._create_ssl_context()
-            t0 = time.time()
-            with urllib.request.urlopen(f"https://www.googleapis.com/youtube/v3/search?{q}", timeout=20, context=ctx) as r:
-                data = json.load(r)
-            elapsed = time.time() - t0
+            t0 = time.perf_counter()
+            data, spent = self._api_get("search", q, cost=100)
+            elapsed = time.perf_counter() - t0
             items = data.get("items", [])
-            logger.log(obs.LOG_INFO, f"🌐 [API] search channels: items={len(items)}, elapsed={elapsed:.2f}s, quota+=100")
+            logger.log(obs.LOG_INFO, f"🌐 [API] search channels: items={len(items)}, elapsed={elapsed:.2f}s, quota+={spent}")
             if items:
                 item = items[0]
                 channel_id = None
@@ -272,43 +601,40 @@ class YouTubeService:
             if t == 'channel_id':
                 channel_id = clean
                 logger.log(obs.LOG_INFO, f"🌐 [API] using channelId directly: {channel_id}")
+            elif clean in self._channel_id_cache:
+                channel_id = self._channel_id_cache[clean]
+                logger.log(obs.LOG_INFO, f"🌐 [API] using cached channelId: @{clean} -> {channel_id}")
             else:
                 channel_id = self._api_search_handle(clean)
                 if not channel_id:
                     logger.log(obs.LOG_INFO, "ℹ️ [API] skip live search (channelId unresolved)")
                     return None
+                self._channel_id_cache[clean] = channel_id
 
-            self.api_call_count += 1
-            self.total_quota_used += 100
             logger.log(obs.LOG_INFO, f"🌐 [API] search live videos by channel: {channel_id}")
-            q1 = urllib.parse.urlencode({
+            q1 = {
                 "part": "id",
                 "channelId": channel_id,
                 "eventType": "live",
                 "type": "video",
                 "key": self.api_key,
                 "maxResults": 1
-            })
-            ctx = self._create_ssl_context()
-            t0 = time.time()
-            with urllib.request.urlopen(f"https://www.googleapis.com/youtube/v3/search?{q1}", timeout=20, context=ctx) as r:
-                data = json.load(r)
-            elapsed = time.time() - t0
+            }
+            t0 = time.perf_counter()
+            data, spent = self._api_get("search", q1, cost=100)
+            elapsed = time.perf_counter() - t0
             items = data.get("items", [])
-            logger.log(obs.LOG_INFO, f"🌐 [API] live search: items={len(items)}, elapsed={elapsed:.2f}s, quota+=100")
+            logger.log(obs.LOG_INFO, f"🌐 [API] live search: items={len(items)}, elapsed={elapsed:.2f}s, quota+={spent}")
 
             if items:
                 video_id = items[0]["id"]["videoId"]
-                self.api_call_count += 1
-                self.total_quota_used += 100
                 logger.log(obs.LOG_INFO, f"🌐 [API] fetch liveStreamingDetails: videoId={video_id}")
-                q2 = urllib.parse.urlencode({"part": "liveStreamingDetails", "id": video_id, "key": self.api_key})
-                t1 = time.time()
-                with urllib.request.urlopen(f"https://www.googleapis.com/youtube/v3/videos?{q2}", timeout=20, context=ctx) as r2:
-                    d2 = json.load(r2)
-                elapsed2 = time.time() - t1
+                q2 = {"part": "liveStreamingDetails", "id": video_id, "key": self.api_key}
+                t1 = time.perf_counter()
+                d2, spent2 = self._api_get("videos", q2, cost=1)
+                elapsed2 = time.perf_counter() - t1
                 items2 = d2.get("items", [])
-                logger.log(obs.LOG_INFO, f"🌐 [API] details: items={len(items2)}, elapsed={elapsed2:.2f}s, quota+=100")
+                logger.log(obs.LOG_INFO, f"🌐 [API] details: items={len(items2)}, elapsed={elapsed2:.2f}s, quota+={spent2}")
                 if items2:
                     details = items2[0].get("liveStreamingDetails", {})
                     has_chat = bool(details.get("activeLiveChatId"))
@@ -329,25 +655,94 @@ class BrowserSourceManager:
         self._refresh_in_progress = False
         self._lock = threading.Lock()
         self.next_refresh_action = 0
+        self._update_signal_cb = None
+        self._weak_src = None
+        self._refresh_steps = deque()
+        self._last_loaded_url = None
+        self._last_refresh_ts = float("-inf")
 
     def _get_src(self):
-        return obs.obs_get_source_by_name(self.source_name)
-
-    def _set_setting_bool(self, src, key, value):
+        # resolve by name once, then go through a weak ref so a removed source is not kept alive
+        weak = self._weak_src
+        if weak is not None:
+            src = obs.obs_weak_source_get_source(weak)
+            if src:
+                if obs.obs_source_get_name(src) == self.source_name:
+                    return src
+                obs.obs_source_release(src)
+            self.release_cached_source()
+        src = obs.obs_get_source_by_name(self.source_name)
+        if src:
+            self._weak_src = obs.obs_source_get_weak_source(src)
+        return src
+
+    def release_cached_source(self):
+        weak, self._weak_src = self._weak_src, None
+        if weak is not None:
+            obs.obs_weak_source_release(weak)
+
+    def get_url(self, src):
         settings = obs.obs_source_get_settings(src)
         try:
-            obs.obs_data_set_bool(settings, key, value)
-            obs.obs_source_update(src, settings)
+            return obs.obs_data_get_string(settings, "url")
         finally:
             obs.obs_data_release(settings)
 
-    def _set_setting_string(self, src, key, value):
+    @property
+    def update_signal_connected(self):
+        return self._update_signal_cb is not None
+
+    def connect_update_signal_main(self, callback):
+        if self._update_signal_cb or not self.source_name:
+            return False
+        src = self._get_src()
+        if not src:
+            logger.log(obs.LOG_WARNING, f"⚠️ [SIGNAL] source not found: {self.source_name}")
+            return False
+        try:
+            sh = obs.obs_source_get_signal_handler(src)
+            obs.signal_handler_connect(sh, "update", callback)
+            self._update_signal_cb = callback
+            logger.log(obs.LOG_INFO, f"📡 [SIGNAL] update handler connected: {self.source_name}")
+            return True
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [SIGNAL] connect error: {e}")
+            return False
+        finally:
+            obs.obs_source_release(src)
+
+    def disconnect_update_signal_main(self):
+        callback, self._update_signal_cb = self._update_signal_cb, None
+        if not callback:
+            return
+        src = self._get_src()
+        if not src:
+            return
+        try:
+            sh = obs.obs_source_get_signal_handler(src)
+            obs.signal_handler_disconnect(sh, "update", callback)
+            logger.log(obs.LOG_INFO, "📡 [SIGNAL] update handler disconnected")
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [SIGNAL] disconnect error: {e}")
+        finally:
+            obs.obs_source_release(src)
+
+    def _apply_settings(self, src, updates):
+        # one settings fetch and one obs_source_update for any number of keys
         settings = obs.obs_source_get_settings(src)
         try:
-            obs.obs_data_set_string(settings, key, value)
+            for key, value in updates.items():
+                if isinstance(value, bool):
+                    obs.obs_data_set_bool(settings, key, value)
+                else:
+                    obs.obs_data_set_string(settings, key, value)
             obs.obs_source_update(src, settings)
         finally:
             obs.obs_data_release(settings)
+        if "url" in updates:
+            self._last_loaded_url = updates["url"]
+        if "refresh_cache" in updates or "restart_when_active" in updates:
+            self._last_refresh_ts = time.monotonic()
 
     def apply_url_to_source_main(self, url):
         if not self.source_name or not url:
@@ -357,96 +752,97 @@ class BrowserSourceManager:
             logger.log(obs.LOG_WARNING, f"⚠️ [OBS] source not found: {self.source_name}")
             return False
         try:
-            self._set_setting_string(src, "url", url)
+            self._apply_settings(src, {"url": url})
             logger.log(obs.LOG_INFO, f"✅ [OBS] url applied: {url}")
             return True
         finally:
             obs.obs_source_release(src)
 
-    def refresh_main(self, expected_url=None):
+    def refresh_main(self, expected_url=None, force=False):
+        # nothing to fix, no reload requested and the page was refreshed recently: leave it alone
+        if (not force and not self.next_refresh_action
+                and expected_url in (None, self._last_loaded_url)
+                and time.monotonic() - self._last_refresh_ts < REFRESH_MIN_GAP):
+            logger.log(obs.LOG_INFO, "⏭️ [REFRESH] skip (url unchanged, refreshed recently)")
+            return
         with self._lock:
             if self._refresh_in_progress:
                 logger.log(obs.LOG_INFO, "⏳ [REFRESH] skip (in-progress)")
                 return
             self._refresh_in_progress = True
 
-        def finish():
-            with self._lock:
-                self._refresh_in_progress = False
-            logger.log(obs.LOG_INFO, "♻️ [REFRESH] complete")
-
         src = self._get_src()
         if not src:
             logger.log(obs.LOG_WARNING, f"⚠️ [REFRESH] source missing: {self.source_name}")
-            finish()
+            self._finish_refresh()
             return
 
         try:
+            # a url fix rides along with the first refresh step instead of its own update
+            fix = {}
             if expected_url:
-                settings = obs.obs_source_get_settings(src)
-                try:
-                    current_url = obs.obs_data_get_string(settings, "url")
-                finally:
-                    obs.obs_data_release(settings)
+                current_url = self.get_url(src)
                 if current_url != expected_url:
                     logger.log(obs.LOG_INFO, f"🔧 [REFRESH] fix url: {current_url} -> {expected_url}")
-                    self._set_setting_string(src, "url", expected_url)
-
-            action = self.next_refresh_action or 0
-            self.next_refresh_action = 0
-
-            if action == 0:
-                def step1():
-                    s = self._get_src()
-                    if not s:
-                        finish()
-                        return
-                    try:
-                        self._set_setting_bool(s, "refresh_cache", True)
-                        logger.log(obs.LOG_INFO, "🔄 [REFRESH] cache=true")
-                    finally:
-                        obs.obs_source_release(s)
-                    def step2():
-                        s2 = self._get_src()
-                        if not s2:
-                            finish()
-                            return
-                        try:
-                            self._set_setting_bool(s2, "refresh_cache", False)
-                            logger.log(obs.LOG_INFO, "🔄 [REFRESH] cache=false")
-                        finally:
-                            obs.obs_source_release(s2)
-                        finish()
-                    _dispatcher.post(step2, delay_ms=80, label="refresh_cache:off")
-                _dispatcher.post(step1, label="refresh_cache:on")
+                    fix["url"] = expected_url
+        finally:
+            obs.obs_source_release(src)
 
-            else:
-                def step1():
-                    s = self._get_src()
-                    if not s:
-                        finish()
-                        return
-                    try:
-                        self._set_setting_bool(s, "restart_when_active", False)
-                        logger.log(obs.LOG_INFO, "🧨 [REFRESH] restart_when_active=false")
-                    finally:
-                        obs.obs_source_release(s)
-                    def step2():
-                        s2 = self._get_src()
-                        if not s2:
-                            finish()
-                            return
-                        try:
-                            self._set_setting_bool(s2, "restart_when_active", True)
-                            logger.log(obs.LOG_INFO, "🧨 [REFRESH] restart_when_active=true")
-                        finally:
-                            obs.obs_source_release(s2)
-                        finish()
-                    _dispatcher.post(step2, delay_ms=200, label="reload:restart=true")
-                _dispatcher.post(step1, label="reload:restart=false")
+        action = self.next_refresh_action or 0
+        self.next_refresh_action = 0
 
+        # (settings, delay_ms before this step, dispatcher label, log line)
+        if action == 0:
+            steps = [
+                ({**fix, "refresh_cache": True}, 0, "refresh_cache:on", "🔄 [REFRESH] cache=true"),
+                ({"refresh_cache": False}, 80, "refresh_cache:off", "🔄 [REFRESH] cache=false"),
+            ]
+        else:
+            steps = [
+                ({**fix, "restart_when_active": False}, 0, "reload:restart=false", "🧨 [REFRESH] restart_when_active=false"),
+                ({"restart_when_active": True}, 200, "reload:restart=true", "🧨 [REFRESH] restart_when_active=true"),
+            ]
+        self._refresh_steps = deque(steps)
+        _dispatcher.post(self._advance_refresh, label=steps[0][2])
+
+    def _advance_refresh(self):
+        updates, _, _, message = self._refresh_steps.popleft()
+        src = self._get_src()
+        if not src:
+            self._refresh_steps.clear()
+            self._finish_refresh()
+            return
+        try:
+            self._apply_settings(src, updates)
+            logger.log(obs.LOG_INFO, message)
+        except Exception:
+            self._refresh_steps.clear()
+            self._finish_refresh()
+            raise
         finally:
             obs.obs_source_release(src)
+        if self._refresh_steps:
+            _, delay_ms, label, _ = self._refresh_steps[0]
+            _dispatcher.post(self._advance_refresh, delay_ms=delay_ms, label=label)
+        else:
+            self._finish_refresh()
+
+    def _finish_refresh(self):
+        with self._lock:
+            self._refresh_in_progress = False
+        logger.log(obs.LOG_INFO, "♻️ [REFRESH] complete")
+
+class RemoteLogEventHandler:
+    def __init__(self, is_remote_log, changed_queue):
+        self._is_remote_log = is_remote_log
+        self._changed = changed_queue
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+            return
+        path = getattr(event, "dest_path", None) or event.src_path
+        if self._is_remote_log(path):
+            self._changed.put(path)
 
 class LogManager:
     def __init__(self, write_log_path, read_log_path, computer_name):
@@ -454,7 +850,65 @@ class LogManager:
         self.read_log_path = read_log_path or ""
         self.computer_name = computer_name or "PC"
         self._last_mtime = None
+        self._last_stat_key = None
         self._lock = threading.Lock()
+        self._observer = None
+        self._changed = queue.Queue()
+        self._last_scan = float("-inf")
+        self._tail_path = None
+        self._tail_offset = 0
+        self._dir_mtime = None
+        self._cached_remote_path = None
+        self._write_fp = None
+        self._write_path = None
+
+    def _is_remote_log(self, path):
+        if self.read_log_path.lower().endswith('.jsonl'):
+            return os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(self.read_log_path))
+        fn = os.path.basename(path)
+        return fn.lower().endswith('.jsonl') and fn != f"{self.computer_name}.jsonl"
+
+    def start_watch(self):
+        # filesystem events replace the per-tick listdir/stat on (often networked) read_log_path
+        if Observer is None or self._observer or not self.read_log_path:
+            return False
+        if self.read_log_path.lower().endswith('.jsonl'):
+            watch_dir = os.path.dirname(self.read_log_path) or "."
+        else:
+            watch_dir = self.read_log_path
+        if not os.path.isdir(watch_dir):
+            return False
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(RemoteLogEventHandler(self._is_remote_log, self._changed), watch_dir, recursive=False)
+            observer.start()
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [REMOTE] watch start error: {e}")
+            return False
+        self._observer = observer
+        logger.log(obs.LOG_INFO, f"👀 [REMOTE] watching: {watch_dir}")
+        return True
+
+    def stop_watch(self, wait=True):
+        observer, self._observer = self._observer, None
+        if not observer:
+            return
+        try:
+            observer.stop()
+            if wait:
+                observer.join(timeout=2)
+            logger.log(obs.LOG_INFO, "👀 [REMOTE] watch stopped")
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [REMOTE] watch stop error: {e}")
+
+    def _next_changed_log_file(self):
+        path = None
+        while True:
+            try:
+                path = self._changed.get_nowait()
+            except queue.Empty:
+                return path
 
     def write_share(self, video_id, popout_chat_url):
         if not self.write_log_path:
@@ -472,17 +926,46 @@ class LogManager:
         if self.write_log_path.lower().endswith('.jsonl'):
             path = self.write_log_path
         else:
-            os.makedirs(self.write_log_path, exist_ok=True)
             path = os.path.join(self.write_log_path, f"{self.computer_name}.jsonl")
 
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._append_line(path, _json_dumps_bytes(entry) + b"\n")
             logger.log(obs.LOG_INFO, "📝 [LOG] share link written")
         except Exception as e:
             logger.log(obs.LOG_ERROR, f"❌ [LOG] write error: {e}")
 
+    def _append_line(self, path, data):
+        # keep the append handle open between writes; reopen once if the path changed or the write failed
+        with self._lock:
+            for attempt in range(2):
+                if self._write_fp is None or self._write_path != path:
+                    self._close_writer()
+                    # directories are only ensured when the handle is (re)opened, not on every write
+                    parent = os.path.dirname(path)
+                    if parent:
+                        os.makedirs(parent, exist_ok=True)
+                    self._write_fp = open(path, "ab", buffering=0)
+                    self._write_path = path
+                try:
+                    self._write_fp.write(data)
+                    return
+                except OSError:
+                    self._close_writer()
+                    if attempt:
+                        raise
+
+    def _close_writer(self):
+        fp, self._write_fp, self._write_path = self._write_fp, None, None
+        if fp is not None:
+            try:
+                fp.close()
+            except OSError:
+                pass
+
+    def close(self):
+        with self._lock:
+            self._close_writer()
+
     def _find_remote_log_file(self):
         if not self.read_log_path:
             return None
@@ -491,39 +974,101 @@ class LogManager:
                 return self.read_log_path
             return None
         try:
-            for fn in os.listdir(self.read_log_path):
-                if not fn.lower().endswith('.jsonl'):
-                    continue
-                if fn == f"{self.computer_name}.jsonl":
-                    continue
-                return os.path.join(self.read_log_path, fn)
-            return None
+            # re-list only when the directory itself changed (file added/removed/renamed)
+            dir_mtime = os.stat(self.read_log_path).st_mtime
+            if dir_mtime == self._dir_mtime and self._cached_remote_path:
+                return self._cached_remote_path
+            found = None
+            with os.scandir(self.read_log_path) as it:
+                for entry in it:
+                    if self._is_remote_log(entry.name) and entry.is_file():
+                        found = entry.path
+                        break
+            self._dir_mtime = dir_mtime
+            self._cached_remote_path = found
+            return found
         except Exception as e:
             logger.log(obs.LOG_WARNING, f"⚠️ [REMOTE] read dir error: {e}")
             return None
 
+    def _iter_lines_reversed(self, path):
+        # walk newlines backwards over a read-only mapping: only the tail pages are ever touched
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while True:
+                    nl = mm.rfind(b"\n", 0, end)
+                    yield mm[nl + 1:end]
+                    if nl < 0:
+                        return
+                    end = nl
+
+    def _read_appended(self, path, offset):
+        # only the bytes appended since the last read; a trailing partial line is left for next time
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        return data[:complete].split(b"\n"), offset + complete
+
+    def _extract_share_link(self, line):
+        # slice the value straight out of the raw bytes; full json parse only if the layout is unexpected
+        idx = line.find(SHARE_LINK_KEY)
+        if idx < 0:
+            return None
+        sep_end = idx + len(SHARE_LINK_KEY)
+        start = line.find(b'"', sep_end)
+        if start >= 0 and not line[sep_end:start].strip(b": "):
+            end = line.find(b'"', start + 1)
+            if end > start and b"\\" not in line[start:end]:
+                return line[start + 1:end].decode("ascii")
+        return _json_loads(line).get("shareLink", "")
+
     def fetch_latest_share(self):
         try:
-            path = self._find_remote_log_file()
-            if not path or not os.path.exists(path):
+            # network shares may never send events, so a quiet watcher still gets a periodic scan
+            now = time.monotonic()
+            watching = self._observer is not None and self._last_mtime is not None
+            path = self._next_changed_log_file() if watching else None
+            if path:
+                self._last_scan = now
+            elif not watching or now - self._last_scan >= WATCH_FALLBACK_SCAN_SECONDS:
+                path = self._find_remote_log_file()
+                self._last_scan = now
+            if not path:
                 return None
-            current_mtime = os.path.getmtime(path)
-            if self._last_mtime is not None and current_mtime <= self._last_mtime:
+            try:
+                st = os.stat(path)
+            except OSError:
                 return None
-            self._last_mtime = current_mtime
-
-            with open(path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            if not lines:
+            # size joins the key: coarse mtime clocks on synced/network shares can miss a quick append
+            stat_key = (path, st.st_mtime_ns, st.st_size)
+            if stat_key == self._last_stat_key:
                 return None
-            for i in range(len(lines)-1, -1, -1):
-                line = lines[i].strip()
+            self._last_stat_key = stat_key
+            self._last_mtime = st.st_mtime
+
+            if path == self._tail_path and self._tail_offset <= st.st_size:
+                lines, self._tail_offset = self._read_appended(path, self._tail_offset)
+                candidates = reversed(lines)
+            else:
+                # first read, another file, or the log shrank (rotation): scan from the end
+                candidates = self._iter_lines_reversed(path)
+                trailing = next(candidates, b"")
+                self._tail_offset = st.st_size - len(trailing)
+                candidates = itertools.chain((trailing,), candidates)
+            self._tail_path = path
+
+            for raw in candidates:
+                line = raw.strip()
                 if not line:
                     continue
                 try:
-                    d = json.loads(line)
-                    share = d.get("shareLink", "")
-                    if SHARE_LINK_PATTERN.match(share):
+                    share = self._extract_share_link(line)
+                    if share and is_share_link(share):
                         logger.log(obs.LOG_INFO, "📨 [REMOTE] new share link")
                         return share
                 except Exception:
@@ -548,16 +1093,20 @@ class LiveChatManager:
         self.update_interval = DEFAULT_UPDATE_INTERVAL
 
         self.yt_service = YouTubeService(api_key=None)
+        self._yt_bucket = TokenBucket(rate_per_s=1 / DEFAULT_UPDATE_INTERVAL, burst=UPDATE_PROBE_BURST)
         self.browser_mgr = BrowserSourceManager(source_name="")
         self.log_mgr = LogManager("", "", "")
 
         self._video_id = None
         self._popout_url = None
         self._pending_video_id = None
+        # writers only: readers take single attribute reads, and _video_id is published before
+        # _pending_video_id is cleared, so a read split across the two still sees a current id
         self._video_lock = threading.Lock()
 
         self._inited = False
         self._streaming_active = False
+        self._last_posted_link = None
 
         self._shutdown_event = threading.Event()
 
@@ -567,13 +1116,21 @@ class LiveChatManager:
         self._monitor_timer_active = False
         self._update_timer_active = False
         self._refresh_timer_active = False
+        self._refresh_interval_ms = REFRESH_INTERVAL_MS
+        self._refresh_dirty = threading.Event()
+        self._timer_lock = threading.Lock()
+        self._desired_timers = set()
 
         self._monitor_timer_fn = self._monitor_callback
         self._update_timer_fn = self._update_callback
         self._refresh_timer_fn = self._refresh_callback
+        self._source_update_fn = self._on_source_updated
 
-        self._update_lock = threading.Lock()
-        self._update_request_in_progress = False
+        self._monitor_q = queue.Queue(maxsize=1)
+        self._update_q = queue.Queue(maxsize=1)
+        # set from enqueue until the job finishes, so a running job also blocks the next tick
+        self._monitor_busy = threading.Event()
+        self._update_busy = threading.Event()
 
     def update_config(self, settings):
         self.api_key = obs.obs_data_get_string(settings, "api_key") or ""
@@ -587,24 +1144,37 @@ class LiveChatManager:
         self.max_init_attempts = obs.obs_data_get_int(settings, "max_init_attempts") or DEFAULT_MAX_INIT_ATTEMPTS
         self.max_init_interval = obs.obs_data_get_int(settings, "max_init_interval") or DEFAULT_MAX_INIT_INTERVAL
         self.update_interval = obs.obs_data_get_int(settings, "update_interval") or DEFAULT_UPDATE_INTERVAL
+        logger.set_min_level(obs.obs_data_get_int(settings, "log_level") or DEFAULT_LOG_LEVEL)
 
         self.yt_service = YouTubeService(api_key=self.api_key if self.api_key else None)
+        # steady rate follows the configured interval; the bucket only bites on timer storms
+        self._yt_bucket = TokenBucket(rate_per_s=1 / self.update_interval, burst=UPDATE_PROBE_BURST)
+        self.browser_mgr.disconnect_update_signal_main()
+        self.browser_mgr.release_cached_source()
         self.browser_mgr = BrowserSourceManager(source_name=self.browser_source_name)
-        self.log_mgr = LogManager(self.write_log_path, self.read_log_path, self.computer_name)
+        log_config = (self.write_log_path, self.read_log_path, self.computer_name)
+        if log_config != (self.log_mgr.write_log_path, self.log_mgr.read_log_path, self.log_mgr.computer_name):
+            # runs on every settings edit: signal the old observer but do not block the UI on its join
+            self.log_mgr.stop_watch(wait=False)
+            self.log_mgr.close()
+            self.log_mgr = LogManager(*log_config)
+        if self._monitor_timer_active:
+            self.browser_mgr.connect_update_signal_main(self._source_update_fn)
+            self.log_mgr.start_watch()
 
     def get_current_video_id(self):
-        with self._video_lock:
-            return self._pending_video_id or self._video_id
+        return self._pending_video_id or self._video_id
 
     def set_primary_video_id(self, video_id):
         with self._video_lock:
             self._video_id = video_id
             if video_id:
-                self._popout_url = f"https://www.youtube.com/live_chat?is_popout=1&v={video_id}"
+                self._popout_url = POPOUT_CHAT_URL.format(video_id)
 
     def set_pending_video_id(self, video_id):
         with self._video_lock:
             self._pending_video_id = video_id
+        self._refresh_dirty.set()
 
     def apply_pending_video_id(self):
         with self._video_lock:
@@ -612,7 +1182,7 @@ class LiveChatManager:
                 return False
             old = self._video_id
             self._video_id = self._pending_video_id
-            self._popout_url = f"https://www.youtube.com/live_chat?is_popout=1&v={self._video_id}"
+            self._popout_url = POPOUT_CHAT_URL.format(self._video_id)
             self._pending_video_id = None
             popout_url = self._popout_url
             vid = self._video_id
@@ -633,6 +1203,36 @@ class LiveChatManager:
         interval = base_interval * (1.5 ** min(failures, 5))
         return min(interval, max_interval)
 
+    def _probe_first_video_id(self, probes):
+        # run the quota-free probes side by side; the first videoId wins and the slower probe is left to finish
+        results = queue.Queue()
+        throttled = []
+
+        def run(name, fn):
+            try:
+                results.put(fn())
+            except ProbeThrottled:
+                throttled.append(name)
+                results.put(None)
+            except Exception as e:
+                logger.log(obs.LOG_ERROR, f"❌ [INIT] {name} unexpected: {e}")
+                results.put(None)
+
+        for name, fn in probes:
+            threading.Thread(target=run, args=(name, fn), daemon=True, name=f"Probe{name}Worker").start()
+        pending = len(probes)
+        while pending:
+            if self._init_stop_event.is_set() or self._shutdown_event.is_set():
+                return None
+            try:
+                video_id = results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            pending -= 1
+            if video_id:
+                return video_id
+        return PROBE_THROTTLED if throttled else None
+
     def _init_worker_main(self):
         logger.log(obs.LOG_INFO, "🧵 [WORKER] InitWorker started")
         attempt_count = 0
@@ -651,18 +1251,28 @@ class LiveChatManager:
             logger.log(obs.LOG_INFO, f"🚀 [INIT] attempt {attempt_count}/{self.max_init_attempts} "
                                      f"(failures={consecutive_failures}, next={current_interval}s)")
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             video_id = None
 
-            try:
-                logger.log(obs.LOG_INFO, "🔎 [INIT/HTML] probing streams page for live videoId...")
-                video_id = self.yt_service.get_video_id_html(self.channel_input, timeout=23)
-            except Exception as e:
-                logger.log(obs.LOG_ERROR, f"❌ [INIT] HTML unexpected: {e}")
+            logger.log(obs.LOG_INFO, "🔎 [INIT/LIVE+HTML] probing /live redirect and streams page concurrently...")
+            video_id = self._probe_first_video_id((
+                ("LIVE", lambda: self.yt_service.get_video_id_via_live(self.channel_input, timeout=10)),
+                ("HTML", lambda: self.yt_service.get_video_id_html(self.channel_input, timeout=23,
+                                                                   cancel_event=self._shutdown_event)),
+            ))
+
+            if video_id is PROBE_THROTTLED:
+                attempt_count -= 1
+                logger.log(obs.LOG_INFO, "⏭️ [INIT] HTML probe throttled, retrying without counting an attempt")
+                if self._init_stop_event.wait(timeout=2) or self._shutdown_event.is_set() or not self._streaming_active:
+                    break
+                continue
 
-            if not video_id and self.api_key and not self._shutdown_event.is_set():
+            if not video_id and self.api_key and not self.yt_service.live_page_changed:
+                logger.log(obs.LOG_INFO, "⏭️ [INIT/API] /live unchanged since last probe -> skip API search")
+            elif not video_id and self.api_key and not self._shutdown_event.is_set():
                 try:
-                    logger.log(obs.LOG_INFO, "🔁 [INIT/API] HTML failed -> trying API fallback")
+                    logger.log(obs.LOG_INFO, "🔁 [INIT/API] LIVE/HTML failed -> trying API fallback")
                     video_id = self.yt_service.get_video_id_api(self.channel_input)
                 except Exception as e:
                     logger.log(obs.LOG_ERROR, f"❌ [INIT] API unexpected: {e}")
@@ -672,7 +1282,7 @@ class LiveChatManager:
 
             if video_id:
                 self.set_primary_video_id(video_id)
-                popout_url = f"https://www.youtube.com/live_chat?is_popout=1&v={video_id}"
+                popout_url = self._popout_url
 
                 _dispatcher.post(
                     lambda: self.browser_mgr.apply_url_to_source_main(popout_url),
@@ -686,13 +1296,11 @@ class LiveChatManager:
                 self._inited = True
                 logger.log(obs.LOG_INFO, f"🏁 [INIT] success! quota={self.yt_service.total_quota_used}")
 
-                _dispatcher.post(self._start_monitor_timer_main, delay_ms=500, label="start_monitor_timer")
-                _dispatcher.post(self._start_refresh_timer_main, delay_ms=900, label="start_refresh_timer")
-                _dispatcher.post(self._start_update_timer_main, delay_ms=1300, label="start_update_timer")
+                self._reconcile_timers(add=("monitor", "refresh", "update"), delay_ms=500)
                 break
 
             consecutive_failures += 1
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             wait_time = max(current_interval - elapsed, 0.5)
             logger.log(obs.LOG_INFO, f"⏭️ [INIT] attempt {attempt_count} failed, retry in {wait_time:.1f}s")
             if self._init_stop_event.wait(timeout=wait_time) or self._shutdown_event.is_set() or not self._streaming_active:
@@ -721,97 +1329,189 @@ class LiveChatManager:
         if not self._streaming_active or self._shutdown_event.is_set():
             return
         logger.log(obs.LOG_INFO, "⏱️ [CALLBACK] monitor fired")
-        def worker():
-            threading.current_thread().name = "MonitorWorker"
-            try:
-                if self._shutdown_event.is_set() or not self._streaming_active:
-                    return
-                _ = self.apply_pending_video_id()
-                if self._shutdown_event.is_set() or not self._streaming_active:
-                    return
-                latest = self.log_mgr.fetch_latest_share()
-                if latest:
-                    self.post_share_link_to_chat(latest)
-            except Exception as e:
-                logger.log(obs.LOG_WARNING, f"⚠️ [CALLBACK] monitor error: {e}")
-        threading.Thread(target=worker, daemon=True).start()
+        if self._monitor_busy.is_set():
+            logger.log(obs.LOG_INFO, "⏭️ [MONITOR] skip (in-progress)")
+            return
+        self._monitor_busy.set()
+        try:
+            self._monitor_q.put_nowait(self._run_monitor_job)
+        except queue.Full:
+            self._monitor_busy.clear()
+            logger.log(obs.LOG_INFO, "⏭️ [MONITOR] skip (job pending)")
 
-    def _update_callback(self):
-        with self._update_lock:
-            if not self._streaming_active or not self._inited or self._shutdown_event.is_set():
+    def _run_monitor_job(self):
+        try:
+            if self._shutdown_event.is_set() or not self._streaming_active:
                 return
-            if self._update_request_in_progress:
-                logger.log(obs.LOG_INFO, "⏭️ [UPDATE] skip (in-progress)")
+            _ = self.apply_pending_video_id()
+            if self._shutdown_event.is_set() or not self._streaming_active:
                 return
-            self._update_request_in_progress = True
+            latest = self.log_mgr.fetch_latest_share()
+            if latest:
+                self.post_share_link_to_chat(latest)
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [CALLBACK] monitor error: {e}")
+        finally:
+            self._monitor_busy.clear()
 
+    def _on_source_updated(self, calldata):
+        # fired by OBS whenever the browser source settings change; only correct a drifted url
+        if self._shutdown_event.is_set() or not self._inited:
+            return
+        expected = self._popout_url
+        if not expected:
+            return
+        try:
+            src = obs.calldata_source(calldata, "source")
+            current_url = self.browser_mgr.get_url(src) if src else None
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [SIGNAL] read url error: {e}")
+            return
+        if current_url is not None and current_url != expected:
+            logger.log(obs.LOG_INFO, f"🔧 [SIGNAL] url drift: {current_url} -> {expected}")
+            _dispatcher.post(lambda: self.browser_mgr.apply_url_to_source_main(expected),
+                             label="signal:fix_url")
+
+    def _update_callback(self):
+        if not self._streaming_active or not self._inited or self._shutdown_event.is_set():
+            return
         logger.log(obs.LOG_INFO, "⏱️ [CALLBACK] update fired")
+        if self._update_busy.is_set():
+            logger.log(obs.LOG_INFO, "⏭️ [UPDATE] skip (in-progress)")
+            return
+        self._update_busy.set()
+        try:
+            self._update_q.put_nowait(self._run_update_job)
+        except queue.Full:
+            self._update_busy.clear()
+            logger.log(obs.LOG_INFO, "⏭️ [UPDATE] skip (job pending)")
 
-        def worker():
-            threading.current_thread().name = "UpdateWorker"
+    def _run_update_job(self):
+        try:
+            if self._shutdown_event.is_set() or not self._streaming_active:
+                return
+            curr = self.get_current_video_id()
+            if not self._yt_bucket.try_consume():
+                logger.log(obs.LOG_INFO, "⏭️ [UPDATE] skip (probe budget exhausted)")
+                return
+            streams_url = self.yt_service.build_streams_url(self.channel_input)
+            t1 = time.perf_counter()
             try:
-                if self._shutdown_event.is_set() or not self._streaming_active:
-                    return
-                streams_url = self.yt_service.build_streams_url(self.channel_input)
-                curr = self.get_current_video_id()
-                logger.log(obs.LOG_INFO, f"🔎 [UPDATE/HTML] probing: url={streams_url}, current={curr}")
-                t1 = time.time()
-                new_video_id = self.yt_service.get_video_id_html(self.channel_input, timeout=23)
-                html_elapsed = time.time() - t1
-                if self._shutdown_event.is_set() or not self._streaming_active:
-                    return
-                logger.log(obs.LOG_INFO, f"ℹ️ [UPDATE/HTML] probe done in {html_elapsed:.2f}s")
-                if new_video_id:
-                    if new_video_id != curr:
-                        logger.log(obs.LOG_INFO, f"🟢 [UPDATE/HTML] got new videoId: {new_video_id} (pending apply)")
-                        self.set_pending_video_id(new_video_id)
-                        self.browser_mgr.next_refresh_action = 0
-                    else:
-                        logger.log(obs.LOG_INFO, "ℹ️ [UPDATE/HTML] same videoId, no change")
-                        self.browser_mgr.next_refresh_action = 0
+                new_video_id = self.yt_service.get_video_id_html(self.channel_input, timeout=23,
+                                                                 cancel_event=self._shutdown_event)
+            except ProbeThrottled:
+                # nothing was fetched: leave the pending id and refresh action alone until the next tick
+                logger.log(obs.LOG_INFO, "⏭️ [UPDATE] skip (HTML probe throttled)")
+                return
+            html_elapsed = time.perf_counter() - t1
+            if self._shutdown_event.is_set() or not self._streaming_active:
+                return
+            if new_video_id:
+                if new_video_id != curr:
+                    outcome = f"🟢 got new videoId: {new_video_id} (pending apply)"
+                    self.set_pending_video_id(new_video_id)
+                    self.browser_mgr.next_refresh_action = 0
                 else:
-                    logger.log(obs.LOG_INFO, "ℹ️ [UPDATE/HTML] no live videoId")
-                    self.browser_mgr.next_refresh_action = 1
-            except Exception as e:
-                logger.log(obs.LOG_WARNING, f"⚠️ [UPDATE] worker error: {e}")
-            finally:
-                with self._update_lock:
-                    self._update_request_in_progress = False
+                    outcome = "ℹ️ same videoId, no change"
+                    self.browser_mgr.next_refresh_action = 0
+            else:
+                outcome = "ℹ️ no live videoId"
+                self.browser_mgr.next_refresh_action = 1
+                self._refresh_dirty.set()
+            # one line per probe instead of probing/done/result; failures still log on their own
+            logger.log(
+                obs.LOG_INFO,
+                f"🔎 [UPDATE/HTML] url={streams_url}, current={curr}, done in {html_elapsed:.2f}s -> {outcome}"
+            )
+        except Exception as e:
+            logger.log(obs.LOG_WARNING, f"⚠️ [UPDATE] worker error: {e}")
+        finally:
+            self._update_busy.clear()
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _job_worker_loop(self, q):
+        while True:
+            job = q.get()
+            if job is None:
+                break
+            job()
+
+    def _start_job_workers(self):
+        # fresh queues per stream so a stop sentinel left in an old queue cannot leak into the next run
+        self._monitor_q = queue.Queue(maxsize=1)
+        self._update_q = queue.Queue(maxsize=1)
+        self._monitor_busy.clear()
+        self._update_busy.clear()
+        for name, q in (("MonitorWorker", self._monitor_q), ("UpdateWorker", self._update_q)):
+            threading.Thread(target=self._job_worker_loop, args=(q,), daemon=True, name=name).start()
+        logger.log(obs.LOG_INFO, "🧵 [WORKER] MonitorWorker/UpdateWorker started")
+
+    def _stop_job_workers(self):
+        # never blocks the main thread: drop a pending job, then hand the worker its stop sentinel
+        for q, busy in ((self._monitor_q, self._monitor_busy), (self._update_q, self._update_busy)):
+            try:
+                q.get_nowait()
+                busy.clear()  # the dropped job will never reach its finally
+            except queue.Empty:
+                pass
+            try:
+                q.put_nowait(None)
+            except queue.Full:
+                pass
 
     def _refresh_callback(self):
         if self._shutdown_event.is_set() or not self._inited or not self._streaming_active:
             return
         logger.log(obs.LOG_INFO, "⏱️ [CALLBACK] refresh fired")
-        current_id = self.get_current_video_id()
-        if not current_id:
+        popout_url = self._popout_url
+        if not popout_url:
             return
-        expected = f"https://www.youtube.com/live_chat?is_popout=1&v={current_id}"
+        # something changed since the last tick: refresh at the normal pace, otherwise keep the
+        # periodic cache refresh but back off to the idle interval
+        if self._refresh_dirty.is_set():
+            self._refresh_dirty.clear()
+            self._set_refresh_interval_main(REFRESH_INTERVAL_MS)
+        else:
+            self._set_refresh_interval_main(REFRESH_IDLE_INTERVAL_MS)
+        # with the update signal connected, url drift is corrected on change instead of every tick
+        expected = None if self.browser_mgr.update_signal_connected else popout_url
         self.browser_mgr.refresh_main(expected_url=expected)
 
-    def _start_monitor_timer(self):
-        logger.log(obs.LOG_INFO, "🕒 [TIMER] request start_monitor")
-        _dispatcher.post(self._start_monitor_timer_main, label="start_monitor_timer")
+    def _reconcile_timers(self, add, delay_ms=0):
+        # any number of start requests collapse into a single main-thread hop (the label is deduped);
+        # stopping happens inline in _stop_all_main, which already runs on the main thread
+        with self._timer_lock:
+            self._desired_timers.update(add)
+        logger.log(obs.LOG_INFO, f"🕒 [TIMER] request reconcile: +{sorted(add)}")
+        _dispatcher.post(self._reconcile_timers_main, delay_ms=delay_ms, label="timers:reconcile")
+
+    def _reconcile_timers_main(self):
+        with self._timer_lock:
+            desired = set(self._desired_timers)
+        for name, active, start, stop in (
+            ("monitor", self._monitor_timer_active, self._start_monitor_timer_main, self._stop_monitor_timer_main),
+            ("refresh", self._refresh_timer_active, self._start_refresh_timer_main, self._stop_refresh_timer_main),
+            ("update", self._update_timer_active, self._start_update_timer_main, self._stop_update_timer_main),
+        ):
+            if name in desired and not active:
+                start()
+            elif name not in desired and active:
+                stop()
 
     def _start_monitor_timer_main(self):
         if not self._monitor_timer_active:
             obs.timer_add(self._monitor_timer_fn, int(self.refresh_cooldown * 1000))
             self._monitor_timer_active = True
             logger.log(obs.LOG_INFO, f"🕒 [TIMER] monitor added ({int(self.refresh_cooldown)}s)")
+            self.browser_mgr.connect_update_signal_main(self._source_update_fn)
+            self.log_mgr.start_watch()
 
     def _stop_monitor_timer_main(self):
         if self._monitor_timer_active:
-            try:
-                obs.timer_remove(self._monitor_timer_fn)
-            except Exception as e:
-                logger.log(obs.LOG_WARNING, f"⚠️ [TIMER] monitor remove error: {e}")
+            obs.timer_remove(self._monitor_timer_fn)
             self._monitor_timer_active = False
             logger.log(obs.LOG_INFO, "🕒 [TIMER] monitor removed")
-
-    def _start_update_timer(self):
-        logger.log(obs.LOG_INFO, "🕒 [TIMER] request start_update")
-        _dispatcher.post(self._start_update_timer_main, label="start_update_timer")
+        self.browser_mgr.disconnect_update_signal_main()
+        self.log_mgr.stop_watch()
 
     def _start_update_timer_main(self):
         if not self._update_timer_active:
@@ -821,38 +1521,35 @@ class LiveChatManager:
 
     def _stop_update_timer_main(self):
         if self._update_timer_active:
-            try:
-                obs.timer_remove(self._update_timer_fn)
-            except Exception as e:
-                logger.log(obs.LOG_WARNING, f"⚠️ [TIMER] update remove error: {e}")
+            obs.timer_remove(self._update_timer_fn)
             self._update_timer_active = False
             logger.log(obs.LOG_INFO, "🕒 [TIMER] update removed")
 
-    def _start_refresh_timer(self):
-        logger.log(obs.LOG_INFO, "🕒 [TIMER] request start_refresh")
-        _dispatcher.post(self._start_refresh_timer_main, label="start_refresh_timer")
-
     def _start_refresh_timer_main(self):
         if not self._refresh_timer_active:
-            obs.timer_add(self._refresh_timer_fn, 10000)
+            self._refresh_interval_ms = REFRESH_INTERVAL_MS
+            obs.timer_add(self._refresh_timer_fn, self._refresh_interval_ms)
             self._refresh_timer_active = True
-            logger.log(obs.LOG_INFO, "🕒 [TIMER] refresh added (10s)")
+            logger.log(obs.LOG_INFO, f"🕒 [TIMER] refresh added ({self._refresh_interval_ms // 1000}s)")
+
+    def _set_refresh_interval_main(self, interval_ms):
+        if not self._refresh_timer_active or interval_ms == self._refresh_interval_ms:
+            return
+        obs.timer_remove(self._refresh_timer_fn)
+        obs.timer_add(self._refresh_timer_fn, interval_ms)
+        self._refresh_interval_ms = interval_ms
+        logger.log(obs.LOG_INFO, f"🕒 [TIMER] refresh interval -> {interval_ms // 1000}s")
 
     def _stop_refresh_timer_main(self):
         if self._refresh_timer_active:
-            try:
-                obs.timer_remove(self._refresh_timer_fn)
-            except Exception as e:
-                logger.log(obs.LOG_WARNING, f"⚠️ [TIMER] refresh remove error: {e}")
+            obs.timer_remove(self._refresh_timer_fn)
             self._refresh_timer_active = False
             logger.log(obs.LOG_INFO, "🕒 [TIMER] refresh removed")
 
     def post_share_link_to_chat(self, link):
-        if not hasattr(self, "_last_posted_link"):
-            self._last_posted_link = None
         if link == self._last_posted_link:
             return
-        if not SHARE_LINK_PATTERN.match(link):
+        if not is_share_link(link):
             return
         try:
             logger.log(obs.LOG_INFO, f"📤 [POST] ready: {link}")
@@ -868,6 +1565,7 @@ class LiveChatManager:
         self._streaming_active = True
         self._reset_state()
         logger.log(obs.LOG_INFO, "🎬 [EVENT] streaming started")
+        self._start_job_workers()
         self._start_init_worker()
 
     def on_stream_stopped(self):
@@ -889,16 +1587,24 @@ class LiveChatManager:
             self._popout_url = None
             self._pending_video_id = None
         self._inited = False
-        with self._update_lock:
-            self._update_request_in_progress = False
+        self._refresh_dirty.clear()
         self._last_posted_link = None
         self._stop_all_main()
 
     def _stop_all_main(self):
+        # break any HTML read first so the init join below and UpdateWorker are not held up
+        self.yt_service.abort_inflight()
         self._stop_init_worker()
-        self._stop_monitor_timer_main()
-        self._stop_update_timer_main()
-        self._stop_refresh_timer_main()
+        self._stop_job_workers()
+        with self._timer_lock:
+            self._desired_timers.clear()
+        # runs the reconcile inline; a pending post may be dropped by _dispatcher.stop()
+        self._reconcile_timers_main()
+        # the update signal and log watch can outlive a failed init; always release them
+        self.browser_mgr.disconnect_update_signal_main()
+        self.log_mgr.stop_watch()
+        self.browser_mgr.release_cached_source()
+        self.log_mgr.close()
 
     def _stop_all(self):
         self._stop_all_main()
@@ -922,6 +1628,10 @@ def script_properties():
     obs.obs_properties_add_int(p, "max_init_attempts", "Maximum Init Attempts", 1, 20, 1)
     obs.obs_properties_add_int(p, "max_init_interval", "Max Init Retry Interval (sec)", 3, 300, 5)
     obs.obs_properties_add_int(p, "update_interval", "Video ID Update Interval (sec)", 10, 300, 5)
+    lvl = obs.obs_properties_add_list(p, "log_level", "Log Level", obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_INT)
+    obs.obs_property_list_add_int(lvl, "Info", obs.LOG_INFO)
+    obs.obs_property_list_add_int(lvl, "Warning", obs.LOG_WARNING)
+    obs.obs_property_list_add_int(lvl, "Error", obs.LOG_ERROR)
     return p
 
 def script_defaults(settings):
@@ -930,6 +1640,7 @@ def script_defaults(settings):
     obs.obs_data_set_default_int(settings, "max_init_attempts", DEFAULT_MAX_INIT_ATTEMPTS)
     obs.obs_data_set_default_int(settings, "max_init_interval", DEFAULT_MAX_INIT_INTERVAL)
     obs.obs_data_set_default_int(settings, "update_interval", DEFAULT_UPDATE_INTERVAL)
+    obs.obs_data_set_default_int(settings, "log_level", DEFAULT_LOG_LEVEL)
     obs.obs_data_set_default_string(settings, "computer_name", "PC1")
 
 def script_update(settings):
@@ -977,10 +1688,9 @@ def script_save(settings):
     pass
 
 def force_refresh_now():
-    current_id = _manager.get_current_video_id()
-    if current_id:
-        expected_url = f"https://www.youtube.com/live_chat?is_popout=1&v={current_id}"
-        _dispatcher.post(lambda: _manager.browser_mgr.refresh_main(expected_url=expected_url),
+    expected_url = _manager._popout_url
+    if expected_url:
+        _dispatcher.post(lambda: _manager.browser_mgr.refresh_main(expected_url=expected_url, force=True),
                          label="debug:refresh_now")
         logger.log(obs.LOG_INFO, "🔧 [DEBUG] refresh queued")
     else: